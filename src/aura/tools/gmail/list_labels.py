@@ -40,11 +40,9 @@ class GmailListLabels(GmailBaseTool):
             if not labels:
                 return "No labels found."
 
-            label_info = []
-            for label in labels:
-                label_info.append(f"ID: {label['id']} - Name: {label['name']}")
-
-            return "\n".join(label_info)
+            return "\n".join(
+                f"ID: {label['id']} - Name: {label['name']}" for label in labels
+            )
 
         except Exception as e:
             self._logger.error(f"Failed to list labels: {str(e)}")
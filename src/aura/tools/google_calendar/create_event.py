@@ -6,7 +6,6 @@ from typing import Optional, Type
 from autogen_core import TRACE_LOGGER_NAME
 from langchain.callbacks.manager import CallbackManagerForToolRun
 from pydantic import BaseModel, Field
-from utils.timezone import get_local_timezone
 
 from .base import GoogleCalendarBaseTool
 from .utils import parse_and_format_datetime
@@ -83,10 +82,6 @@ class GoogleCalendarCreateEvent(GoogleCalendarBaseTool):
         run_manager: Optional[CallbackManagerForToolRun] = None,
     ) -> str:
         try:
-            if timezone is None:
-                zone_info = get_local_timezone()
-                timezone = str(zone_info)
-
             start_rfc, end_rfc, timezone = parse_and_format_datetime(
                 start_datetime, end_datetime, timezone
             )
@@ -7,7 +7,6 @@ from autogen_core import TRACE_LOGGER_NAME
 from googleapiclient.errors import HttpError
 from langchain.callbacks.manager import CallbackManagerForToolRun
 from pydantic import BaseModel, Field
-from utils.timezone import get_local_timezone
 
 from .base import GoogleCalendarBaseTool
 from .utils import parse_and_format_datetime
@@ -131,9 +130,6 @@ class GoogleCalendarEditEvent(GoogleCalendarBaseTool):
                 event["summary"] = summary
 
             if start_datetime is not None and end_datetime is not None:
-                if timezone is None:
-                    timezone = str(get_local_timezone())
-
                 start_rfc, end_rfc, timezone = parse_and_format_datetime(
                     start_datetime, end_datetime, timezone
                 )
@@ -152,10 +148,11 @@ class GoogleCalendarEditEvent(GoogleCalendarBaseTool):
 
             if add_attendees:
                 # Add new attendees
+                current_emails = {a["email"] for a in current_attendees}
                 new_attendees = [
                     {"email": email}
                     for email in add_attendees
-                    if email not in [a["email"] for a in current_attendees]
+                    if email not in current_emails
                 ]
                 current_attendees.extend(new_attendees)
 
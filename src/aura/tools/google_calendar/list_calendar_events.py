@@ -7,14 +7,19 @@ from autogen_core import TRACE_LOGGER_NAME
 from dateutil import parser, tz
 from googleapiclient.errors import HttpError
 from langchain.callbacks.manager import (
+    AsyncCallbackManagerForToolRun,
     CallbackManagerForToolRun,
 )
 from pydantic import BaseModel, Field
-from utils.timezone import get_local_timezone
 
 from .base import GoogleCalendarBaseTool
 from .utils import parse_and_format_datetime
 
+EVENT_FIELDS = ("summary", "description", "location", "hangoutLink", "attendees")
+# Partial responses: only request the properties _parse_event reads.
+EVENTS_LIST_FIELDS = f"items({','.join(('start', 'end') + EVENT_FIELDS)})"
+CALENDAR_LIST_FIELDS = "items(id,selected)"
+
 
 class GetEventsSchema(BaseModel):
     # https://developers.google.com/calendar/api/v3/reference/events/list
@@ -68,29 +73,25 @@ class GoogleCalendarListEvents(GoogleCalendarBaseTool):
 
     _logger = logging.getLogger(f"{TRACE_LOGGER_NAME}.{name}")
 
-    def _parse_event(self, event, timezone):
+    def _parse_event(self, event, zone):
         # convert to local timezone
         start = event["start"].get("dateTime", event["start"].get("date"))
-        start = (
-            parser.parse(start)
-            .astimezone(tz.gettz(timezone))
-            .strftime("%Y/%m/%d %H:%M:%S")
-        )
+        start = parser.parse(start).astimezone(zone).strftime("%Y/%m/%d %H:%M:%S")
         end = event["end"].get("dateTime", event["end"].get("date"))
-        end = (
-            parser.parse(end)
-            .astimezone(tz.gettz(timezone))
-            .strftime("%Y/%m/%d %H:%M:%S")
-        )
+        end = parser.parse(end).astimezone(zone).strftime("%Y/%m/%d %H:%M:%S")
         event_parsed = dict(start=start, end=end)
-        for field in ["summary", "description", "location", "hangoutLink", "attendees"]:
+        for field in EVENT_FIELDS:
             event_parsed[field] = event.get(field, None)
         return event_parsed
 
     def _get_calendars(self):
         calendars = []
         try:
-            calendar_list = self.api_resource.calendarList().list().execute()
+            calendar_list = (
+                self.api_resource.calendarList()
+                .list(fields=CALENDAR_LIST_FIELDS)
+                .execute()
+            )
             for cal in calendar_list.get("items", []):
                 if cal.get("selected", None):
                     calendars.append(cal["id"])
@@ -109,10 +110,8 @@ class GoogleCalendarListEvents(GoogleCalendarBaseTool):
     ) -> List[Dict[str, Any]]:
         try:
             calendars = self._get_calendars()
-
-            if timezone is None:
-                zone_info = get_local_timezone()
-                timezone = str(zone_info)
+            if not calendars:
+                return []
 
             events = []
 
@@ -120,28 +119,27 @@ class GoogleCalendarListEvents(GoogleCalendarBaseTool):
                 start_datetime, end_datetime, timezone
             )
 
+            events_resource = self.api_resource.events()
             for cal in calendars:
-                events_result = (
-                    self.api_resource.events()
-                    .list(
-                        calendarId=cal,
-                        timeMin=start_rfc,
-                        timeMax=end_rfc,
-                        maxResults=max_results,
-                        singleEvents=True,
-                        orderBy="startTime",
-                        timeZone=timezone,
-                    )
-                    .execute()
-                )
+                events_result = events_resource.list(
+                    calendarId=cal,
+                    timeMin=start_rfc,
+                    timeMax=end_rfc,
+                    maxResults=max_results,
+                    singleEvents=True,
+                    orderBy="startTime",
+                    timeZone=timezone,
+                    fields=EVENTS_LIST_FIELDS,
+                ).execute()
                 cal_events = events_result.get("items", [])
                 events.extend(cal_events)
 
-            events = sorted(
-                events, key=lambda x: x["start"].get("dateTime", x["start"].get("date"))
+            events.sort(
+                key=lambda x: x["start"].get("dateTime", x["start"].get("date"))
             )
 
-            return [self._parse_event(e, timezone) for e in events]
+            zone = tz.gettz(timezone)
+            return [self._parse_event(e, zone) for e in events]
 
         except HttpError as error:
             self._logger.error(f"Failed to retrieve calendar events: {error}")
@@ -155,7 +153,9 @@ class GoogleCalendarListEvents(GoogleCalendarBaseTool):
         start_datetime: str,
         end_datetime: str,
         max_results: int = 10,
-        run_manager: Optional[CallbackManagerForToolRun] = None,
-    ) -> List(Dict[str, Any]):  # type: ignore
-
+        timezone: Optional[str] = None,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+    ) -> List[Dict[str, Any]]:
+        # googleapiclient has no async transport and its httplib2 client is not
+        # thread-safe, so _run cannot simply be offloaded to a worker thread.
         raise NotImplementedError("Async version of this tool is not implemented.")
@@ -2,74 +2,58 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, tzinfo
+import functools
 import logging
 import os
-from typing import List, Optional, Tuple, TYPE_CHECKING
-
-from dateutil import tz
-from utils.timezone import get_local_timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from google.auth.transport.requests import Request  # type: ignore[import]
     from google.oauth2.credentials import Credentials  # type: ignore[import]
-    from google.oauth2.service_account import Credentials as ServiceCredentials
-    from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore[import]
     from googleapiclient.discovery import Resource  # type: ignore[import]
-    from googleapiclient.discovery import build as build_resource
 
 logger = logging.getLogger(__name__)
 
 
-def import_google() -> Tuple[Request, Credentials, ServiceCredentials]:
-    """Import google libraries.
-
-    Returns:
-        Tuple[Request, Credentials]: Request and Credentials classes.
-    """
-    try:
-        from google.auth.transport.requests import Request  # noqa: F401
-        from google.oauth2.credentials import Credentials  # noqa: F401
-        from google.oauth2.service_account import Credentials as ServiceCredentials
-    except ImportError:
-        raise ImportError(
-            "You need to install gmail dependencies to use this toolkit. "
-            "Try running poetry install --with gmail"
-        )
-    return Request, Credentials, ServiceCredentials  # type: ignore[return-value]
+_GOOGLE_ATTRS = frozenset(
+    ("Request", "Credentials", "ServiceCredentials", "InstalledAppFlow", "build")
+)
 
 
-def import_installed_app_flow() -> InstalledAppFlow:
-    """Import InstalledAppFlow class.
+@functools.cache
+def _google_mods() -> SimpleNamespace:
+    """Import the Google client libraries once and return them as a namespace.
 
     Returns:
-        InstalledAppFlow: InstalledAppFlow class.
+        SimpleNamespace: Request, Credentials, ServiceCredentials,
+            InstalledAppFlow and build.
     """
     try:
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google.oauth2.service_account import Credentials as ServiceCredentials
         from google_auth_oauthlib.flow import InstalledAppFlow
+        from googleapiclient.discovery import build
     except ImportError:
         raise ImportError(
             "You need to install gmail dependencies to use this toolkit. "
-            "Please, install bigquery dependency group: "
-            "`pip install langchain-google-community[gmail]`"
+            "Try running pip install langchain-google-community[gmail]"
         )
-    return InstalledAppFlow
+    return SimpleNamespace(
+        Request=Request,
+        Credentials=Credentials,
+        ServiceCredentials=ServiceCredentials,
+        InstalledAppFlow=InstalledAppFlow,
+        build=build,
+    )
 
 
-def import_googleapiclient_resource_builder() -> build_resource:
-    """Import googleapiclient.discovery.build function.
-
-    Returns:
-        build_resource: googleapiclient.discovery.build function.
-    """
-    try:
-        from googleapiclient.discovery import build
-    except ImportError:
-        raise ImportError(
-            "You need to install all dependencies to use this toolkit. "
-            "Try running pip install langchain-google-community"
-        )
-    return build
+def __getattr__(name: str) -> Any:
+    """Expose the Google client classes as lazily imported module attributes."""
+    if name not in _GOOGLE_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_google_mods(), name)
 
 
 DEFAULT_SCOPES = ["https://www.googleapis.com/auth/calendar"]
@@ -81,6 +65,39 @@ DEFAULT_CREDS_TOKEN_FILE = "token.json"
 DEFAULT_CLIENT_SECRETS_FILE = "credentials.json"
 DEFAULT_SERVICE_ACCOUNT_FILE = "service_account.json"
 
+# Built services keyed on everything that determines their credentials, so
+# repeated builds reuse the authorized Resource instead of re-reading tokens.
+_RESOURCE_CACHE: Dict[Tuple[Any, ...], Tuple[Credentials, Resource]] = {}
+
+# Parsed token files keyed by path, invalidated when the file's mtime changes.
+_TOKEN_CACHE: Dict[str, Tuple[int, Credentials]] = {}
+
+
+def _load_token(token_file: str, scopes: List[str]) -> Optional[Credentials]:
+    """Load user credentials from a token file, reusing the last parse."""
+    try:
+        mtime = os.stat(token_file).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _TOKEN_CACHE.get(token_file)
+    if cached is not None:
+        cached_mtime, creds = cached
+        if cached_mtime == mtime and set(creds.scopes or []) == set(scopes):
+            return creds
+
+    Credentials = _google_mods().Credentials
+    creds = Credentials.from_authorized_user_file(token_file, scopes)
+    _TOKEN_CACHE[token_file] = (mtime, creds)
+    return creds
+
+
+def _save_token(token_file: str, creds: Credentials) -> None:
+    """Persist user credentials so later runs can skip the auth flow."""
+    with open(token_file, "w") as token:
+        token.write(creds.to_json())
+    _TOKEN_CACHE[token_file] = (os.stat(token_file).st_mtime_ns, creds)
+
 
 def get_gmail_credentials(
     token_file: Optional[str] = None,
@@ -92,10 +109,10 @@ def get_gmail_credentials(
 ) -> Credentials:
     """Get credentials."""
     if use_domain_wide:
-        _, _, ServiceCredentials = import_google()
+        g = _google_mods()
         service_account_file = service_account_file or DEFAULT_SERVICE_ACCOUNT_FILE
         scopes = scopes or DEFAULT_SERVICE_SCOPES
-        credentials = ServiceCredentials.from_service_account_file(
+        credentials = g.ServiceCredentials.from_service_account_file(
             service_account_file, scopes=scopes
         )
 
@@ -105,9 +122,7 @@ def get_gmail_credentials(
         return credentials
     else:
         # From https://developers.google.com/gmail/api/quickstart/python
-        Request, Credentials, _ = import_google()
-        InstalledAppFlow = import_installed_app_flow()
-        creds = None
+        g = _google_mods()
         scopes = scopes or DEFAULT_SCOPES
         token_file = token_file or DEFAULT_CREDS_TOKEN_FILE
         client_secrets_file = client_secrets_file or DEFAULT_CLIENT_SECRETS_FILE
@@ -115,21 +130,19 @@ def get_gmail_credentials(
         # created automatically when the authorization flow completes for the first
         # time.
 
-        if os.path.exists(token_file):
-            creds = Credentials.from_authorized_user_file(token_file, scopes)
+        creds = _load_token(token_file, scopes)
 
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())  # type: ignore[call-arg]
+                creds.refresh(g.Request())  # type: ignore[call-arg]
             else:
                 # https://developers.google.com/gmail/api/quickstart/python#authorize_credentials_for_a_desktop_application # noqa
-                flow = InstalledAppFlow.from_client_secrets_file(
+                flow = g.InstalledAppFlow.from_client_secrets_file(
                     client_secrets_file, scopes
                 )
                 creds = flow.run_local_server(port=0)
 
-            with open(token_file, "w") as token:
-                token.write(creds.to_json())
+            _save_token(token_file, creds)
 
         return creds
 
@@ -143,15 +156,67 @@ def build_resource_service(
     service_account_file: Optional[str] = None,
     scopes: Optional[List[str]] = None,
 ) -> Resource:
-    """Build a Gmail service."""
-    credentials = credentials or get_gmail_credentials(
+    """Build a Gmail service.
+
+    Services built from stored credentials are cached per service, user and
+    scopes; the cached credentials are refreshed in place once they expire.
+    """
+    if credentials is not None:
+        return _google_mods().build(
+            service_name, service_version, credentials=credentials
+        )
+
+    key = (
+        service_name,
+        service_version,
+        delegated_user,
+        tuple(sorted(scopes or [])),
+        use_domain_wide,
+        service_account_file,
+    )
+    cached = _RESOURCE_CACHE.get(key)
+    if cached is not None:
+        creds, resource = cached
+        # Service account credentials mint new tokens from their key on demand.
+        if use_domain_wide or creds.valid:
+            return resource
+        if creds.expired and creds.refresh_token:
+            creds.refresh(_google_mods().Request())  # type: ignore[call-arg]
+            _save_token(DEFAULT_CREDS_TOKEN_FILE, creds)
+            return resource
+
+    creds = get_gmail_credentials(
         use_domain_wide=use_domain_wide,
         delegated_user=delegated_user,
         service_account_file=service_account_file,
         scopes=scopes,
     )
-    builder = import_googleapiclient_resource_builder()
-    return builder(service_name, service_version, credentials=credentials)
+    resource = _google_mods().build(service_name, service_version, credentials=creds)
+    _RESOURCE_CACHE[key] = (creds, resource)
+    return resource
+
+
+@functools.lru_cache(maxsize=128)
+def _tzinfo(name: str) -> Optional[tzinfo]:
+    """Resolve a TZ Database name to a tzinfo, reusing previous lookups."""
+    from dateutil import tz
+
+    return tz.gettz(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _local_timezone_name() -> str:
+    """Return the name of the system timezone, resolved once per process."""
+    from utils.timezone import get_local_timezone
+
+    return str(get_local_timezone())
+
+
+def _localize(value: datetime, zone: Optional[tzinfo]) -> datetime:
+    """Attach ``zone`` to a naive datetime or convert an aware one to it."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=zone)
+    return value.astimezone(zone)
 
 
 def parse_and_format_datetime(
@@ -160,21 +225,29 @@ def parse_and_format_datetime(
     """
     Parse datetime strings and return RFC3339 formatted strings with timezone.
 
+    Inputs are ISO 8601 strings as accepted by ``datetime.fromisoformat``. Naive
+    values are taken to be in ``timezone``; values carrying an offset (including
+    a trailing "Z") are converted to it.
+
     Args:
         start_datetime: Start datetime string in format "YYYY-MM-DDTHH:MM:SS"
         end_datetime: End datetime string in format "YYYY-MM-DDTHH:MM:SS"
-        timezone: Optional timezone string (e.g. 'America/New_York')
+        timezone: Optional timezone string (e.g. 'America/New_York'), defaults to
+            the system timezone
 
     Returns:
         Tuple of (start_rfc, end_rfc, timezone)
     """
     if timezone is None:
-        timezone = str(get_local_timezone())
+        timezone = _local_timezone_name()
 
-    start = datetime.strptime(start_datetime, "%Y-%m-%dT%H:%M:%S")
-    end = datetime.strptime(end_datetime, "%Y-%m-%dT%H:%M:%S")
+    zone = _tzinfo(timezone)
 
-    start = start.replace(tzinfo=tz.gettz(timezone))
-    end = end.replace(tzinfo=tz.gettz(timezone))
+    start = _localize(datetime.fromisoformat(start_datetime), zone)
+    end = _localize(datetime.fromisoformat(end_datetime), zone)
 
-    return start.isoformat(), end.isoformat(), timezone
+    return (
+        start.isoformat(timespec="seconds"),
+        end.isoformat(timespec="seconds"),
+        timezone,
+    )